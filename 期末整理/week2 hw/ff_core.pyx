@@ -0,0 +1,93 @@
+# cython: language_level=3
+# =========================================================
+# Compiled core for GF(p) scalar arithmetic
+# Build next to finite_field_homework.py with:
+#     cythonize -i ff_core.pyx
+# finite_field_homework.py falls back to GFNumber when this
+# module is not built.
+# =========================================================
+
+ctypedef unsigned long long u64
+
+
+cdef inline u64 _powmod(u64 a, u64 e, u64 p):
+    # right-to-left binary exponentiation; p < 2**32 so r * a fits
+    cdef u64 r = 1
+    a %= p
+    while e:
+        if e & 1:
+            r = (r * a) % p
+        a = (a * a) % p
+        e >>= 1
+    return r
+
+
+cdef class FFElem:
+    """Element of GF(p) for p < 2**32, with uint64 arithmetic
+
+    Mirrors GFNumber's public surface: FFElem(field, value) with .field,
+    .elem, .value and .prime.
+    """
+
+    cdef readonly object field
+    cdef readonly u64 value
+    cdef readonly u64 prime
+
+    def __init__(self, field, value):
+        if not 2 <= field.prime < 2**32:
+            raise ValueError("FFElem needs 2 <= prime < 2**32")
+        self.field = field
+        self.prime = field.prime
+        self.value = value % field.prime
+
+    @property
+    def elem(self):
+        return self.field.element(self.value)
+
+    def __add__(FFElem self, FFElem other):
+        _check_same_field(self, other)
+        cdef u64 s = self.value + other.value
+        return _mk(s - self.prime if s >= self.prime else s, self)
+
+    def __sub__(FFElem self, FFElem other):
+        _check_same_field(self, other)
+        cdef u64 s = self.value + (self.prime - other.value)
+        return _mk(s - self.prime if s >= self.prime else s, self)
+
+    def __mul__(FFElem self, FFElem other):
+        _check_same_field(self, other)
+        return _mk((self.value * other.value) % self.prime, self)
+
+    def __truediv__(FFElem self, FFElem other):
+        _check_same_field(self, other)
+        if other.value == 0:
+            raise ZeroDivisionError("0 has no multiplicative inverse")
+        cdef u64 inv = _powmod(other.value, self.prime - 2, self.prime)
+        return _mk((self.value * inv) % self.prime, self)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, FFElem) and
+            self.value == (<FFElem>other).value and
+            self.prime == (<FFElem>other).prime
+        )
+
+    def __hash__(self):
+        return hash((self.value, self.prime))
+
+    def __repr__(self):
+        return f"GF({self.prime})({self.value})"
+
+
+cdef inline void _check_same_field(FFElem a, FFElem b) except *:
+    if a.prime != b.prime:
+        raise ValueError("cannot mix elements of different fields")
+
+
+cdef inline FFElem _mk(u64 value, FFElem like):
+    # value is already reduced, so skip __init__; field comes from like
+    cdef FFElem e = FFElem.__new__(FFElem)
+    e.field = like.field
+    e.value = value
+    e.prime = like.prime
+    return e
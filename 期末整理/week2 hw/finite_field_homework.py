@@ -6,12 +6,97 @@
 import random
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; kernels then run as plain Python
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+try:
+    from ff_core import FFElem  # optional Cython build, see ff_core.pyx
+except ImportError:
+    FFElem = None
+
+# =========================================================
+# Modular Exponentiation Kernel
+# =========================================================
+
+@njit("uint64(uint64, uint64, uint64)", cache=True)
+def _powmod(a, e, p):
+    # right-to-left binary exponentiation; needs p < 2**32 so r * a fits
+    one = np.uint64(1)
+    r = one
+    a %= p
+    while e:
+        if e & one:
+            r = (r * a) % p
+        a = (a * a) % p
+        e >>= one
+    return r
+
+
+def _pseudo_mersenne_reduce(prime):
+    """Shift-add reduction of products mod p = 2**k - c, or None
+
+    Two folds of x = lo + c * hi bring a product below 2p as long as
+    c * (c + 2) <= 2**k, leaving one conditional subtract. In CPython this
+    is no faster than % for 2**255 - 19 and only pulls clearly ahead from
+    about 320 bits (around 3x at 2**521 - 1), so smaller primes get None.
+    """
+    k = prime.bit_length()
+    c = (1 << k) - prime
+    if k < 320 or c >= 1024 or c * (c + 2) > (1 << k):
+        return None
+    mask = (1 << k) - 1
+
+    def reduce(x):
+        x = (x & mask) + c * (x >> k)
+        x = (x & mask) + c * (x >> k)
+        return x - prime if x >= prime else x
+
+    return reduce
+
+
+def _inverse_mod(value, prime):
+    # Fermat's little theorem
+    # the kernel only pays off compiled; as plain Python, builtin pow wins
+    if _HAS_NUMBA and prime.bit_length() <= 32:
+        return int(_powmod(value, prime - 2, prime))
+    return pow(value, prime - 2, prime)
+
+
+def _exact(x):
+    # fixed-width ints wrap around silently; switch to Python ints
+    x = np.asarray(x)
+    return x.astype(object) if x.dtype.kind in "iu" else x
+
+
+def _bulk_operands(a, b, fits_int64):
+    # normalise lists and narrower dtypes (e.g. int32) before any arithmetic:
+    # int64 when the result is known to fit, Python ints otherwise
+    if fits_int64:
+        return np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+    return _exact(a), _exact(b)
+
+
 # =========================================================
 # Abstract Group Definition
 # =========================================================
 
 class Group(ABC):
-    """Abstract base class for mathematical groups"""
+    """Abstract base class for mathematical groups
+
+    operation/inverse work on single elements; batched work should go
+    through the concrete groups' op_bulk, which takes and returns arrays
+    of plain values instead of element objects.
+    """
 
     @property
     @abstractmethod
@@ -31,7 +116,7 @@ class Group(ABC):
         pass
 
     def random_generate(self):
-        elements = self._get_all_elements()
+        elements = list(self._get_all_elements())
         return random.choice(elements)
 
     def _get_all_elements(self):
@@ -49,6 +134,14 @@ class FiniteFieldElement:
         self.prime = prime
         self.value = value % prime
 
+    @classmethod
+    def _from_reduced(cls, value, prime):
+        # caller guarantees 0 <= value < prime, so skip the modulo
+        e = cls.__new__(cls)
+        e.prime = prime
+        e.value = value
+        return e
+
     def __eq__(self, other):
         return (
             isinstance(other, FiniteFieldElement) and
@@ -60,58 +153,141 @@ class FiniteFieldElement:
         return f"GF({self.prime})({self.value})"
 
 
+# =========================================================
+# Shared Base for the Groups of GF(p)
+# =========================================================
+
+class _FiniteFieldGroup(Group):
+    """Interned 0 and 1 shared by the additive and multiplicative groups"""
+
+    def __init__(self, prime):
+        self.prime = prime
+        self._zero = FiniteFieldElement(0, prime)
+        self._one = FiniteFieldElement(1, prime)
+
+    def _wrap(self, v):
+        # reuse the interned 0 and 1 rather than allocating new elements
+        if v == 0:
+            return self._zero
+        if v == 1:
+            return self._one
+        return FiniteFieldElement._from_reduced(v, self.prime)
+
+
 # =========================================================
 # Additive Group of GF(p)
 # =========================================================
 
-class FiniteFieldAddGroup(Group):
+class FiniteFieldAddGroup(_FiniteFieldGroup):
     """Additive group of finite field GF(p)"""
 
     def __init__(self, prime):
-        self.prime = prime
-        self._identity = FiniteFieldElement(0, prime)
+        super().__init__(prime)
+        self._identity = self._zero
 
     @property
     def identity(self):
         return self._identity
 
     def operation(self, a, b):
-        return FiniteFieldElement(a.value + b.value, self.prime)
+        s = a.value + b.value
+        return self._wrap(s - self.prime if s >= self.prime else s)
 
     def inverse(self, a):
-        return FiniteFieldElement(-a.value, self.prime)
+        return self._wrap(self.prime - a.value if a.value else 0)
+
+    def op_bulk(self, a, b):
+        """Batched operation on int arrays of values (no element objects)"""
+        a, b = _bulk_operands(a, b, self.prime <= 2**62)
+        s = a + b
+        if s.dtype == object:
+            return s % self.prime
+        # inputs are in [0, p), so subtract p where s >= p using a mask
+        # (all ones or all zeros) instead of a division or a branch
+        return s - (self.prime & -(s >= self.prime).astype(s.dtype))
 
     def include(self, element):
         return isinstance(element, FiniteFieldElement) and element.prime == self.prime
 
+    def random_generate(self):
+        # sample an int directly instead of materializing all p elements
+        return FiniteFieldElement._from_reduced(random.randrange(0, self.prime), self.prime)
+
     def _get_all_elements(self):
-        return [FiniteFieldElement(i, self.prime) for i in range(self.prime)]
+        # lazy, and only meant for small demo fields
+        if self.prime >= 10000:
+            raise ValueError("listing all elements is only supported for prime < 10000")
+        return (FiniteFieldElement._from_reduced(i, self.prime) for i in range(self.prime))
 
 
 # =========================================================
 # Multiplicative Group of GF(p) (excluding 0)
 # =========================================================
 
-class FiniteFieldMulGroup(Group):
+class FiniteFieldMulGroup(_FiniteFieldGroup):
     """Multiplicative group of finite field GF(p)"""
 
     def __init__(self, prime):
-        self.prime = prime
-        self._identity = FiniteFieldElement(1, prime)
+        super().__init__(prime)
+        self._identity = self._one
+        self._reduce = _pseudo_mersenne_reduce(prime)
+        if self._reduce is not None:
+            # pick the multiply once, so plain primes pay no extra check
+            self.operation = self._reduced_operation
+
+        # Montgomery parameters: R = 2**k > p must be coprime to p, so the
+        # even prime 2 uses k = 0 (R = 1), where REDC degenerates to x % p
+        k = prime.bit_length() if prime % 2 else 0
+        R = 1 << k
+        self._mont_k = k
+        self._mont_mask = R - 1
+        self._mont_r2 = (R * R) % prime
+        self._mont_nprime = (-pow(prime, -1, R)) % R
 
     @property
     def identity(self):
         return self._identity
 
     def operation(self, a, b):
-        return FiniteFieldElement(a.value * b.value, self.prime)
+        return self._wrap(a.value * b.value % self.prime)
+
+    def _reduced_operation(self, a, b):
+        return self._wrap(self._reduce(a.value * b.value))
+
+    def op_bulk(self, a, b):
+        """Batched operation on int arrays of values (no element objects)"""
+        a, b = _bulk_operands(a, b, self.prime <= 2**31)
+        return (a * b) % self.prime
+
+    # -----------------------------------------------------
+    # Montgomery arithmetic on plain ints: to_mont once, mont_mul
+    # repeatedly, from_mont at the end. Kept to show the algorithm; in
+    # CPython each REDC costs several big-int ops, so this is slower
+    # than a plain % at every prime size.
+    # -----------------------------------------------------
+
+    def _redc(self, t):
+        # t * R^-1 mod p for 0 <= t < p * R, using only mask, shift and add
+        m = ((t & self._mont_mask) * self._mont_nprime) & self._mont_mask
+        t = (t + m * self.prime) >> self._mont_k
+        return t - self.prime if t >= self.prime else t
+
+    def to_mont(self, x):
+        """Convert an int to Montgomery form x * R mod p"""
+        return self._redc((x % self.prime) * self._mont_r2)
+
+    def from_mont(self, x):
+        """Convert a value in Montgomery form back to an ordinary residue"""
+        return self._redc(x)
+
+    def mont_mul(self, a, b):
+        """Multiply two values in Montgomery form (not faster than % in CPython)"""
+        return self._redc(a * b)
 
     def inverse(self, a):
         if a.value == 0:
             raise ZeroDivisionError("0 has no multiplicative inverse")
-        # Fermat's little theorem
-        inv = pow(a.value, self.prime - 2, self.prime)
-        return FiniteFieldElement(inv, self.prime)
+        return self._wrap(_inverse_mod(a.value, self.prime))
 
     def include(self, element):
         return (
@@ -120,14 +296,51 @@ class FiniteFieldMulGroup(Group):
             element.value != 0
         )
 
+    def random_generate(self):
+        # skip 0, which is not in the multiplicative group
+        return FiniteFieldElement._from_reduced(random.randrange(1, self.prime), self.prime)
+
     def _get_all_elements(self):
-        return [FiniteFieldElement(i, self.prime) for i in range(1, self.prime)]
+        # lazy, and only meant for small demo fields
+        if self.prime >= 10000:
+            raise ValueError("listing all elements is only supported for prime < 10000")
+        return (FiniteFieldElement._from_reduced(i, self.prime) for i in range(1, self.prime))
 
 
 # =========================================================
 # Finite Field GF(p)
 # =========================================================
 
+def make_gf(prime):
+    """Bare int functions (add, neg, mul, minv) for GF(prime)
+
+    Closed over prime, so hot loops can call them without any method
+    lookup on group objects; values must already be reduced.
+    """
+    def add(a, b):
+        s = a + b
+        return s - prime if s >= prime else s
+
+    def neg(a):
+        return prime - a if a else 0
+
+    reduce = _pseudo_mersenne_reduce(prime)
+
+    if reduce is not None:
+        def mul(a, b):
+            return reduce(a * b)
+    else:
+        def mul(a, b):
+            return (a * b) % prime
+
+    def minv(a):
+        if a == 0:
+            raise ZeroDivisionError("0 has no multiplicative inverse")
+        return _inverse_mod(a, prime)
+
+    return add, neg, mul, minv
+
+
 class FiniteField:
     """Finite field GF(p)"""
 
@@ -135,64 +348,117 @@ class FiniteField:
         self.prime = prime
         self.add_group = FiniteFieldAddGroup(prime)
         self.mul_group = FiniteFieldMulGroup(prime)
+        self._add, self._neg, self._mul, self._minv = make_gf(prime)
 
     def element(self, value):
         return FiniteFieldElement(value, self.prime)
 
+    def number(self, value):
+        """Operator-overloaded number: compiled FFElem if built, else GFNumber"""
+        if FFElem is not None and self.prime < 2**32:
+            return FFElem(self, value)
+        return GFNumber(self, value)
+
 
 # =========================================================
 # Operator Overloading Version
 # =========================================================
 
 class GFNumber:
-    """Finite field number with operator overloading"""
+    """Finite field number with operator overloading
+
+    Arithmetic works on the reduced int through the field's make_gf
+    functions instead of the group objects, so each operator allocates
+    only its result.
+    """
 
     def __init__(self, field, value):
         self.field = field
-        self.elem = field.element(value)
+        self._p = field.prime
+        self._v = value % self._p
+
+    @property
+    def elem(self):
+        return FiniteFieldElement._from_reduced(self._v, self._p)
+
+    @property
+    def value(self):
+        return self._v
+
+    @property
+    def prime(self):
+        return self._p
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, GFNumber) and
+            self._v == other._v and
+            self._p == other._p
+        )
+
+    def __hash__(self):
+        return hash((self._v, self._p))
 
     def __add__(self, other):
-        r = self.field.add_group.operation(self.elem, other.elem)
-        return GFNumber(self.field, r.value)
+        _check_same_field(self, other)
+        return _new(self.field, self.field._add(self._v, other._v))
 
     def __sub__(self, other):
-        inv = self.field.add_group.inverse(other.elem)
-        r = self.field.add_group.operation(self.elem, inv)
-        return GFNumber(self.field, r.value)
+        _check_same_field(self, other)
+        f = self.field
+        return _new(f, f._add(self._v, f._neg(other._v)))
 
     def __mul__(self, other):
-        r = self.field.mul_group.operation(self.elem, other.elem)
-        return GFNumber(self.field, r.value)
+        _check_same_field(self, other)
+        return _new(self.field, self.field._mul(self._v, other._v))
 
     def __truediv__(self, other):
-        inv = self.field.mul_group.inverse(other.elem)
-        r = self.field.mul_group.operation(self.elem, inv)
-        return GFNumber(self.field, r.value)
+        _check_same_field(self, other)
+        f = self.field
+        return _new(f, f._mul(self._v, f._minv(other._v)))
 
     def __repr__(self):
-        return f"GF({self.field.prime})({self.elem.value})"
+        return f"GF({self._p})({self._v})"
+
+
+def _check_same_field(a, b):
+    if a._p != b._p:
+        raise ValueError("cannot mix elements of different fields")
+
+
+def _new(field, value):
+    # build a GFNumber from an already reduced value, skipping __init__
+    out = GFNumber.__new__(GFNumber)
+    out.field = field
+    out._p = field.prime
+    out._v = value
+    return out
 
 
 # =========================================================
 # Field Axiom Checks
 # =========================================================
 
+def _random_vector(low, high, size):
+    # int64 products overflow once p exceeds 2**31, so fall back to Python ints;
+    # NumPy is seeded from `random` so random.seed() governs both paths
+    if high <= 2**31:
+        rng = np.random.default_rng(random.getrandbits(64))
+        return rng.integers(low, high, size=size, dtype=np.int64)
+    return np.array([random.randrange(low, high) for _ in range(size)], dtype=object)
+
+
 def check_distributivity(field, trials=50):
-    for _ in range(trials):
-        a = field.mul_group.random_generate()
-        b = field.add_group.random_generate()
-        c = field.add_group.random_generate()
-
-        left = field.mul_group.operation(
-            a,
-            field.add_group.operation(b, c)
-        )
-        right = field.add_group.operation(
-            field.mul_group.operation(a, b),
-            field.mul_group.operation(a, c)
-        )
+    p = field.prime
+    a = _random_vector(1, p, trials)
+    b = _random_vector(0, p, trials)
+    c = _random_vector(0, p, trials)
+
+    add, mul = field.add_group.op_bulk, field.mul_group.op_bulk
+    left = mul(a, add(b, c))
+    right = add(mul(a, b), mul(a, c))
 
-        assert left == right
+    assert np.array_equal(left, right)
 
 
 def check_field(field):
@@ -1,5 +1,41 @@
 import math
 
+import numpy as np
+
+# a * b + c helpers, chosen once at import. math.fma (Python 3.13+) rounds
+# once per step, so results can differ from the plain expressions in the
+# last bit; older Pythons use the plain expressions.
+if hasattr(math, "fma"):
+    from math import fma
+
+    def _rotate_xy(x, y, cos_t, sin_t, cx, cy):
+        return fma(x, cos_t, fma(-y, sin_t, cx)), fma(x, sin_t, fma(y, cos_t, cy))
+
+    def _dot2(a, x, b, y):
+        return fma(a, x, b * y)
+
+    def _step_xy(k, dx, dy, x0, y0):
+        return fma(k, dx, x0), fma(k, dy, y0)
+else:
+    def _rotate_xy(x, y, cos_t, sin_t, cx, cy):
+        return cx + x * cos_t - y * sin_t, cy + x * sin_t + y * cos_t
+
+    def _dot2(a, x, b, y):
+        return a * x + b * y
+
+    def _step_xy(k, dx, dy, x0, y0):
+        return x0 + k * dx, y0 + k * dy
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; kernels then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
 # --------------------
 # Point
 # --------------------
@@ -15,37 +51,41 @@ class Point:
         return Point(self.x + dx, self.y + dy)
 
     def scale(self, k, center=None):
-        center = center or Point(0, 0)
+        center = center if center is not None else _ORIGIN
         return Point(
             center.x + k * (self.x - center.x),
             center.y + k * (self.y - center.y)
         )
 
     def rotate(self, theta, center=None):
-        center = center or Point(0, 0)
+        center = center if center is not None else _ORIGIN
         cos_t, sin_t = math.cos(theta), math.sin(theta)
         x, y = self.x - center.x, self.y - center.y
-        return Point(
-            center.x + x * cos_t - y * sin_t,
-            center.y + x * sin_t + y * cos_t
-        )
+        return Point(*_rotate_xy(x, y, cos_t, sin_t, center.x, center.y))
 
     def __repr__(self):
         return f"Point({self.x:.3f}, {self.y:.3f})"
 
 
+_ORIGIN = Point(0.0, 0.0)
+
+
 # --------------------
 # Line: ax + by + c = 0
 # --------------------
 class Line:
     def __init__(self, a, b, c):
         self.a, self.b, self.c = float(a), float(b), float(c)
+        # |(a, b)| and friends, shared by every intersection with this line
+        self._n2 = self.a*self.a + self.b*self.b
+        self._n = math.sqrt(self._n2)
+        self._inv_n = 1.0 / self._n if self._n else math.inf
 
     @classmethod
     def from_points(cls, p1, p2):
         a = p2.y - p1.y
         b = p1.x - p2.x
-        c = -(a * p1.x + b * p1.y)
+        c = -_dot2(a, p1.x, b, p1.y)
         return cls(a, b, c)
 
     def intersection(self, other):
@@ -73,38 +113,63 @@ class Circle:
         if d > self.radius + other.radius or d < abs(self.radius - other.radius):
             return []
 
-        a = (self.radius**2 - other.radius**2 + d**2) / (2 * d)
+        inv_d = 1.0 / d
+        a = (self.radius**2 - other.radius**2 + d**2) * 0.5 * inv_d
         h = math.sqrt(max(self.radius**2 - a**2, 0))
 
         x0, y0 = self.center.x, self.center.y
         x1, y1 = other.center.x, other.center.y
 
-        xm = x0 + a * (x1 - x0) / d
-        ym = y0 + a * (y1 - y0) / d
+        a_d = a * inv_d
+        h_d = h * inv_d
 
-        rx = -(y1 - y0) * (h / d)
-        ry = (x1 - x0) * (h / d)
+        xm, ym = _step_xy(a_d, x1 - x0, y1 - y0, x0, y0)
+
+        rx = -(y1 - y0) * h_d
+        ry = (x1 - x0) * h_d
 
         return [
             Point(xm + rx, ym + ry),
             Point(xm - rx, ym - ry)
         ]
 
+    def intersect_many(self, others):
+        """Intersect with each circle in others in one batched kernel call.
+
+        Returns (out, mask): out[i] holds the two intersection points with
+        others[i] as a (2, 2) array, NaN where mask[i] is False.
+        """
+        n = len(others)
+        x1 = np.array([o.center.x for o in others], dtype=np.float64)
+        y1 = np.array([o.center.y for o in others], dtype=np.float64)
+        r1 = np.array([o.radius for o in others], dtype=np.float64)
+        x0 = np.full(n, self.center.x)
+        y0 = np.full(n, self.center.y)
+        r0 = np.full(n, self.radius)
+        # the kernel skips rejected pairs, so those rows stay NaN
+        out = np.full((n, 2, 2), np.nan)
+        mask = np.empty(n, dtype=np.bool_)
+        _intersect_circles(x0, y0, r0, x1, y1, r1, out, mask)
+        return out, mask
+
     def intersect_line(self, line):
         a, b, c = line.a, line.b, line.c
         x0, y0 = self.center.x, self.center.y
 
-        d = abs(a*x0 + b*y0 + c) / math.hypot(a, b)
+        norm2, inv = line._n2, line._inv_n
+        e = a*x0 + b*y0 + c
+
+        d = abs(e) * inv
         if d > self.radius:
             return []
 
-        t = -(a*x0 + b*y0 + c) / (a*a + b*b)
+        t = -e / norm2
         xh = x0 + a * t
         yh = y0 + b * t
 
-        h = math.sqrt(max(self.radius**2 - d**2, 0))
-        dx = -b / math.hypot(a, b)
-        dy = a / math.hypot(a, b)
+        h = math.sqrt(max(self.radius*self.radius - d*d, 0))
+        dx = -b * inv
+        dy = a * inv
 
         return [
             Point(xh + dx*h, yh + dy*h),
@@ -112,6 +177,38 @@ class Circle:
         ]
 
 
+# explicit signature: compiled (or loaded from the on-disk cache) at import
+@njit("void(float64[:], float64[:], float64[:], float64[:], float64[:], float64[:],"
+      " float64[:, :, :], boolean[:])",
+      parallel=True, fastmath=True, cache=True)
+def _intersect_circles(x0, y0, r0, x1, y1, r1, out, mask):
+    # same math as Circle.intersect_circle, one circle pair per index
+    for i in prange(x0.size):
+        dx = x1[i] - x0[i]
+        dy = y1[i] - y0[i]
+        d = math.sqrt(dx*dx + dy*dy)
+        if d == 0.0 or d > r0[i] + r1[i] or d < abs(r0[i] - r1[i]):
+            mask[i] = False
+            continue
+
+        inv_d = 1.0 / d
+        a = (r0[i]*r0[i] - r1[i]*r1[i] + d*d) * 0.5 * inv_d
+        h = math.sqrt(max(r0[i]*r0[i] - a*a, 0.0))
+
+        a_d = a * inv_d
+        h_d = h * inv_d
+        xm = x0[i] + a_d * dx
+        ym = y0[i] + a_d * dy
+        rx = -dy * h_d
+        ry = dx * h_d
+
+        out[i, 0, 0] = xm + rx
+        out[i, 0, 1] = ym + ry
+        out[i, 1, 0] = xm - rx
+        out[i, 1, 1] = ym - ry
+        mask[i] = True
+
+
 # --------------------
 # Triangle
 # --------------------
@@ -126,26 +223,134 @@ class Triangle:
         return Triangle(*[p.scale(k, center) for p in self.points])
 
     def rotate(self, theta, center=None):
-        return Triangle(*[p.rotate(theta, center) for p in self.points])
+        # compute cos/sin once for all three vertices
+        center = center if center is not None else _ORIGIN
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+        cx, cy = center.x, center.y
+        return Triangle(*[
+            Point(*_rotate_xy(p.x - cx, p.y - cy, cos_t, sin_t, cx, cy))
+            for p in self.points
+        ])
+
+    def to_cloud(self):
+        return PointCloud([(p.x, p.y) for p in self.points])
+
+    @classmethod
+    def from_cloud(cls, cloud):
+        # tolist() yields plain Python floats rather than np.float64
+        return cls(*[Point(x, y) for x, y in cloud.xy.tolist()])
 
     def __repr__(self):
         return f"Triangle{tuple(self.points)}"
 
 
+# --------------------
+# PointCloud: (N, 2) array of points
+# --------------------
+def _center_array(center):
+    # accept a Point as well as an (x, y) pair
+    if isinstance(center, Point):
+        return np.array([center.x, center.y])
+    return np.asarray(center, dtype=np.float64)
+
+
+class PointCloud:
+    def __init__(self, xy):
+        self.xy = np.ascontiguousarray(xy, dtype=np.float64).reshape(-1, 2)
+
+    def translate(self, dx, dy):
+        return PointCloud(self.xy + (dx, dy))
+
+    def scale(self, k, center=(0.0, 0.0)):
+        c = _center_array(center)
+        return PointCloud(c + k * (self.xy - c))
+
+    def rotate(self, theta, center=(0.0, 0.0)):
+        return PointCloud(rotate_points(self.xy, theta, center))
+
+    def __len__(self):
+        return len(self.xy)
+
+    def __repr__(self):
+        return f"PointCloud({len(self)} points)"
+
+
 # --------------------
 # Utility Functions
 # --------------------
+def _foot_xy(px, py, a, b, c, n2):
+    # project (px, py) onto ax + by + c = 0, with n2 = a*a + b*b
+    t = -(a*px + b*py + c) / n2
+    return px + a*t, py + b*t
+
+
+def _dist2(x1, y1, x2, y2):
+    dx, dy = x1 - x2, y1 - y2
+    return dx*dx + dy*dy
+
+
 def foot_of_perpendicular(p, line):
-    perp = line.perpendicular_through(p)
-    return line.intersection(perp)
+    if line._n2 == 0:
+        # a = b = 0 is not a line, so there is no foot
+        return None
+    return Point(*_foot_xy(p.x, p.y, line.a, line.b, line.c, line._n2))
 
 
 def verify_pythagorean(line, p):
-    foot = foot_of_perpendicular(p, line)
-    base = Point(0, -line.c / line.b) if abs(line.b) > 1e-9 else Point(-line.c / line.a, 0)
+    # PH^2 + HA^2 = PA^2 on squared distances; no Points or sqrt needed
+    a, b, c = line.a, line.b, line.c
+    fx, fy = _foot_xy(p.x, p.y, a, b, c, line._n2)
+    bx, by = (0.0, -c / b) if abs(b) > 1e-9 else (-c / a, 0.0)
+
+    d1 = _dist2(p.x, p.y, fx, fy)
+    d2 = _dist2(fx, fy, bx, by)
+    d3 = _dist2(p.x, p.y, bx, by)
+
+    return abs(d1 + d2 - d3) < 1e-6
+
+
+def rotate_points(xy, theta, center=(0.0, 0.0)):
+    """Rotate an (N, 2) array of points by theta about center"""
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    R = np.array([[cos_t, -sin_t], [sin_t, cos_t]])
+    c = _center_array(center)
+    return (np.asarray(xy, dtype=np.float64) - c) @ R.T + c
+
 
-    a = p.distance(foot)
-    b = foot.distance(base)
-    c = p.distance(base)
+def intersect_lines_batch(circles, lines):
+    """Intersect circles[i] with lines[i] for every i without branching.
+
+    Returns (out, mask) like Circle.intersect_many: out is (N, 2, 2) with
+    NaN rows where the line misses the circle, and mask marks valid rows.
+    """
+    x0 = np.array([c.center.x for c in circles], dtype=np.float64)
+    y0 = np.array([c.center.y for c in circles], dtype=np.float64)
+    r = np.array([c.radius for c in circles], dtype=np.float64)
+    a = np.array([ln.a for ln in lines], dtype=np.float64)
+    b = np.array([ln.b for ln in lines], dtype=np.float64)
+    c = np.array([ln.c for ln in lines], dtype=np.float64)
+    norm2 = np.array([ln._n2 for ln in lines], dtype=np.float64)
+    inv = np.array([ln._inv_n for ln in lines], dtype=np.float64)
+
+    # degenerate lines (a = b = 0) give inf/NaN here; mask drops them
+    with np.errstate(divide="ignore", invalid="ignore"):
+        e = a*x0 + b*y0 + c
+
+        d = np.abs(e) * inv
+        mask = d <= r
+
+        t = -e / norm2
+        xh = x0 + a * t
+        yh = y0 + b * t
 
-    return abs(a*a + b*b - c*c) < 1e-6
+        h = np.sqrt(np.maximum(r*r - d*d, 0.0))
+        dx = -b * inv
+        dy = a * inv
+
+    out = np.empty((len(x0), 2, 2))
+    out[:, 0, 0] = xh + dx*h
+    out[:, 0, 1] = yh + dy*h
+    out[:, 1, 0] = xh - dx*h
+    out[:, 1, 1] = yh - dy*h
+    out[~mask] = np.nan
+    return out, mask